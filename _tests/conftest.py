@@ -1,32 +1,218 @@
+import asyncio
+from typing import Any, NamedTuple, Optional
+
+import orjson
 import pytest
-import aiohttp
-from unittest.mock import AsyncMock, MagicMock
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from multidict import MultiDict
 from app.core.third_party_integrations.manychat.client import ManyChatClient
+from app.core.third_party_integrations.manychat.config import ManyChatConfig
+
+# Endpoints served by the in-process ManyChat test server
+ROUTES = (
+    ("GET", "/fb/page/getInfo"),
+    ("GET", "/fb/page/getTags"),
+    ("POST", "/fb/page/setBotFields"),
+    ("POST", "/fb/subscriber/addTagByName"),
+    ("GET", "/fb/subscriber/getInfo"),
+)
+
+
+def _payload(data):
+    """Serialize a canned API response once, as the server sends it."""
+    return orjson.dumps(data)
+
+
+SUCCESS_BODY = b'{"status":"success"}'
+
+
+class _StubResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(self, body=SUCCESS_BODY, status=200):
+        self.body = body
+        self.status = status
+        self.headers = {}
+
+    async def read(self):
+        return self.body
+
+
+class _AsyncCtx:
+    def __init__(self, resp):
+        self.resp = resp
+
+    async def __aenter__(self):
+        return self.resp
+
+    async def __aexit__(self, *a):
+        return False
+
+
+class _StubSession:
+    """Session stub that returns one canned response and records the last call."""
+    closed = False
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.last_call = None
+
+    def request(self, method, url, **kw):
+        self.last_call = (method, url, kw)
+        return _AsyncCtx(self._resp)
+
+    async def close(self):
+        self.closed = True
 
-@pytest.fixture
-def mock_config():
-    class MockConfig:
-        api_key = "test_api_key"
-        base_url = "https://api.manychat.com"
-        timeout = 30
-        max_retries = 3
-    return MockConfig()
+
+class RecordedCall(NamedTuple):
+    """A request received by the in-process ManyChat test server."""
+    method: str
+    path: str
+    authorization: Optional[str]
+    query: MultiDict
+    json: Any
+
+
+class ManyChatStub:
+    """Canned responses and recorded calls behind the test server."""
+
+    def __init__(self):
+        self.responses = {}
+        self.calls = []
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def respond(self, path, body, *, status=200, content_type="application/json"):
+        self.responses[path] = (body, status, content_type)
+
+    def reset(self):
+        self.responses.clear()
+        self.calls.clear()
+        self.delay = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        body = await request.json() if request.body_exists else None
+        self.calls.append(RecordedCall(
+            request.method,
+            request.path,
+            request.headers.get("Authorization"),
+            request.query.copy(),
+            body,
+        ))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        body, status, content_type = self.responses.get(
+            request.path, (SUCCESS_BODY, 200, "application/json")
+        )
+        return web.Response(body=body, status=status, content_type=content_type)
+
+def pytest_collection_modifyitems(items):
+    # Run every async test on the session loop that owns the shared server and client
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+@pytest.fixture(scope="session")
+def success_payload():
+    return _payload({"status": "success"})
+
+@pytest.fixture(scope="session")
+def page_info_payload():
+    return _payload({
+        "status": "success",
+        "data": {
+            "id": 12345,
+            "name": "Test Page",
+            "category": "Test Category",
+            "is_pro": True,
+            "timezone": "UTC"
+        }
+    })
+
+@pytest.fixture(scope="session")
+def tags_payload():
+    return _payload({
+        "status": "success",
+        "data": [
+            {"id": 1, "name": "Tag 1"},
+            {"id": 2, "name": "Tag 2"}
+        ]
+    })
+
+@pytest.fixture(scope="session")
+def bot_fields_payload():
+    return _payload({
+        "status": "success",
+        "data": [
+            {"field_id": 1, "success": True},
+            {"field_name": "test", "success": True}
+        ]
+    })
+
+@pytest.fixture(scope="session")
+def subscriber_info_payload():
+    return _payload({
+        "status": "success",
+        "data": {
+            "id": "12345",
+            "page_id": "67890",
+            "first_name": "John",
+            "last_name": "Doe",
+            "email": "john@example.com",
+            "tags": [{"id": 1, "name": "VIP"}]
+        }
+    })
+
+@pytest.fixture(scope="session")
+def _manychat_stub():
+    return ManyChatStub()
 
 @pytest.fixture
-async def mock_client(mock_config):
-    async with aiohttp.ClientSession() as session:
-        client = ManyChatClient(config=mock_config)
-        client._session = session
+def manychat_stub(_manychat_stub):
+    _manychat_stub.reset()
+    return _manychat_stub
+
+@pytest_asyncio.fixture(scope="session")
+async def manychat_server(_manychat_stub):
+    app = web.Application()
+    for method, path in ROUTES:
+        app.router.add_route(method, path, _manychat_stub.handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+@pytest.fixture(scope="session")
+def server_config(manychat_server):
+    return ManyChatConfig(
+        api_key="test_api_key",
+        base_url=str(manychat_server.make_url("")),
+    )
+
+@pytest_asyncio.fixture(scope="session")
+async def _server_client(server_config):
+    async with ManyChatClient(config=server_config) as client:
         yield client
-        await client.close()
 
 @pytest.fixture
-def mock_http_client(monkeypatch):
-    mock_session = AsyncMock()
-    mock_response = AsyncMock()
-    mock_response.json = AsyncMock(return_value={"status": "success"})
-    mock_session.request.return_value.__aenter__.return_value = mock_response
-    
-    client = ManyChatClient(api_key="test_api_key")
-    monkeypatch.setattr(client, "_session", mock_session)
-    return client, mock_session, mock_response
\ No newline at end of file
+def server_client(_server_client):
+    _server_client.clear_cache()
+    return _server_client
+
+@pytest.fixture
+def mock_http_client():
+    response = _StubResponse()
+    session = _StubSession(response)
+    client = ManyChatClient(api_key="test_api_key", session=session)
+    return client, session, response
\ No newline at end of file
@@ -1,23 +1,44 @@
 import pytest
-from app.core.third_party_integrations.manychat.api.facebook.subscriber.addTagByName import add_tag_by_name
+from app.core.third_party_integrations.manychat.api.facebook.subscriber.addTagByName import (
+    add_tag_by_name,
+    add_tag_by_name_validated,
+)
 from app.core.third_party_integrations.manychat.api._responses import SuccessResponse
+from app.core.third_party_integrations.manychat.api.facebook.subscriber._requests import AddTagByNameRequest
 
 @pytest.mark.asyncio
-async def test_add_tag_by_name_success(mock_http_client):
-    client, mock_session, mock_response = mock_http_client
-    mock_response.json.return_value = {"status": "success"}
+async def test_add_tag_by_name_success(server_client, manychat_stub, success_payload):
+    manychat_stub.respond("/fb/subscriber/addTagByName", success_payload)
     
     result = await add_tag_by_name(
-        client,
+        server_client,
         subscriber_id="12345",
         tag_name="VIP"
     )
     
     assert isinstance(result, SuccessResponse)
     assert result.status == "success"
-    mock_session.request.assert_awaited_once_with(
-        "POST",
-        "https://api.manychat.com/fb/subscriber/addTagByName",
-        headers={"Authorization": "Bearer test_api_key"},
-        json={"subscriber_id": "12345", "tag_name": "VIP"}
-    )
\ No newline at end of file
+    (call,) = manychat_stub.calls
+    assert call.method == "POST"
+    assert call.path == "/fb/subscriber/addTagByName"
+    assert call.authorization == "Bearer test_api_key"
+    assert call.json == {"subscriber_id": "12345", "tag_name": "VIP"}
+
+@pytest.mark.asyncio
+async def test_add_tag_by_name_validated_sends_same_body(server_client, manychat_stub, success_payload):
+    manychat_stub.respond("/fb/subscriber/addTagByName", success_payload)
+    
+    await add_tag_by_name(server_client, subscriber_id="12345", tag_name="VIP")
+    await add_tag_by_name_validated(server_client, subscriber_id="12345", tag_name="VIP")
+    
+    fast, validated = manychat_stub.calls
+    assert fast.json == validated.json == {"subscriber_id": "12345", "tag_name": "VIP"}
+
+def test_add_tag_request_copy_reserializes_body():
+    request = AddTagByNameRequest(subscriber_id="1", tag_name="a")
+    assert request.as_json_bytes == b'{"subscriber_id":"1","tag_name":"a"}'
+    
+    copy = request.model_copy(update={"tag_name": "b"})
+    
+    assert copy.as_json_bytes == b'{"subscriber_id":"1","tag_name":"b"}'
+    assert request.as_json_bytes == b'{"subscriber_id":"1","tag_name":"a"}'
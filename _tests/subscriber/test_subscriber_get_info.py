@@ -1,25 +1,15 @@
 import pytest
 from datetime import datetime
 from app.core.third_party_integrations.manychat.api.facebook.subscriber.getInfo import get_subscriber_info
+from app.core.third_party_integrations.manychat.api.facebook.subscriber._requests import GetSubscriberInfoRequest
 from app.core.third_party_integrations.manychat.api.facebook.subscriber._responses import GetSubscriberInfoResponse
 
 @pytest.mark.asyncio
-async def test_get_subscriber_info_success(mock_http_client):
-    client, mock_session, mock_response = mock_http_client
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": {
-            "id": "12345",
-            "page_id": "67890",
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john@example.com",
-            "tags": [{"id": 1, "name": "VIP"}]
-        }
-    }
+async def test_get_subscriber_info_success(server_client, manychat_stub, subscriber_info_payload):
+    manychat_stub.respond("/fb/subscriber/getInfo", subscriber_info_payload)
     
     result = await get_subscriber_info(
-        client,
+        server_client,
         subscriber_id="12345",
         fields=["first_name", "last_name", "email"]
     )
@@ -29,12 +19,18 @@ async def test_get_subscriber_info_success(mock_http_client):
     assert result.data.id == "12345"
     assert result.data.first_name == "John"
     assert len(result.data.tags) == 1
-    mock_session.request.assert_awaited_once_with(
-        "GET",
-        "https://api.manychat.com/fb/subscriber/getInfo",
-        headers={"Authorization": "Bearer test_api_key"},
-        params={
-            "subscriber_id": "12345",
-            "fields": ["first_name", "last_name", "email"]
-        }
-    )
\ No newline at end of file
+    (call,) = manychat_stub.calls
+    assert call.method == "GET"
+    assert call.path == "/fb/subscriber/getInfo"
+    assert call.authorization == "Bearer test_api_key"
+    assert call.query["subscriber_id"] == "12345"
+    assert call.query.getall("fields") == ["first_name", "last_name", "email"]
+
+def test_get_subscriber_info_request_copy_rebuilds_params():
+    request = GetSubscriberInfoRequest(subscriber_id="1")
+    assert request.as_params == {"subscriber_id": "1"}
+    
+    copy = request.model_copy(update={"subscriber_id": "2"})
+    
+    assert copy.as_params == {"subscriber_id": "2"}
+    assert request.as_params == {"subscriber_id": "1"}
@@ -0,0 +1,196 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import threading
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from app.core.third_party_integrations.manychat.api.facebook.getInfo import get_page_info
+from app.core.third_party_integrations.manychat.api.facebook.subscriber.addTagByName import add_tag_by_name
+from app.core.third_party_integrations.manychat.api.facebook.subscriber.getInfo import get_subscriber_info
+from app.core.third_party_integrations.manychat.api.facebook.subscriber._responses import GetSubscriberInfoResponse, SubscriberInfo
+from app.core.third_party_integrations.manychat.api._exceptions import ManyChatAPIError, ManyChatAuthError, ManyChatValidationError
+from app.core.third_party_integrations.manychat.api._responses import SuccessResponse
+from app.core.third_party_integrations.manychat.client import ManyChatClient, get_client
+
+@pytest.mark.asyncio
+async def test_concurrent_add_tags(server_config, manychat_stub):
+    manychat_stub.delay = 0.01
+    config = server_config.model_copy(update={"pool_limit_per_host": 5})
+    
+    async with ManyChatClient(config=config) as client:
+        results = await client.batch(
+            add_tag_by_name(client, subscriber_id=str(i), tag_name="VIP")
+            for i in range(100)
+        )
+    
+    assert all(isinstance(result, SuccessResponse) for result in results)
+    assert len(manychat_stub.calls) == 100
+    assert 1 < manychat_stub.max_in_flight <= 5
+
+@pytest.mark.asyncio
+async def test_request_sends_cached_headers_and_url(mock_http_client, page_info_payload):
+    client, session, response = mock_http_client
+    response.body = page_info_payload
+    
+    result = await get_page_info(client)
+    
+    assert result.data.name == "Test Page"
+    method, url, kwargs = session.last_call
+    assert method == "GET"
+    assert url == "https://api.manychat.com/fb/page/getInfo"
+    assert kwargs == {"headers": {"Authorization": "Bearer test_api_key"}, "json": None}
+
+@pytest.mark.asyncio
+async def test_trusted_responses_skip_validation(server_config, manychat_stub, subscriber_info_payload):
+    manychat_stub.respond("/fb/subscriber/getInfo", subscriber_info_payload)
+    config = server_config.model_copy(update={"validate_responses": False})
+    
+    async with ManyChatClient(config=config) as client:
+        result = await get_subscriber_info(client, subscriber_id="12345")
+    
+    assert isinstance(result.data, SubscriberInfo)
+    assert result.data.first_name == "John"
+    assert result.data.tags[0]["name"] == "VIP"
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [
+    b"not json",
+    b"[1]",
+    b'{"status": "success"}',
+    b'{"status": "error", "data": {}}',
+])
+async def test_trusted_responses_reject_malformed_bodies(mock_http_client, body):
+    client, _, response = mock_http_client
+    client.config.validate_responses = False
+    response.body = body
+    
+    with pytest.raises(ManyChatValidationError):
+        await get_page_info(client)
+
+@pytest.mark.asyncio
+async def test_non_json_error_body_raises_api_error(server_client, manychat_stub):
+    manychat_stub.respond(
+        "/fb/page/getInfo", b"<html>Bad Gateway</html>", status=502, content_type="text/html"
+    )
+    
+    with pytest.raises(ManyChatAPIError) as excinfo:
+        await get_page_info(server_client)
+    
+    assert excinfo.value.status_code == 502
+    assert excinfo.value.response == "<html>Bad Gateway</html>"
+
+@pytest.mark.asyncio
+async def test_unauthorized_response_raises_auth_error(server_client, manychat_stub):
+    manychat_stub.respond("/fb/page/getInfo", b'{"status":"error"}', status=401)
+    
+    with pytest.raises(ManyChatAuthError):
+        await get_page_info(server_client)
+
+@pytest.mark.asyncio
+async def test_cached_requests_are_keyed_by_params_and_body(server_client, manychat_stub):
+    for params in ({"fields": ["a", "b"]}, {"fields": ["a", "b"]}, {"fields": ["a"]}):
+        await server_client.request("GET", "fb/subscriber/getInfo", params=params, cache=True)
+    for body in ({"tag_name": "a"}, {"tag_name": "a"}, {"tag_name": "b"}):
+        await server_client.request("POST", "fb/subscriber/addTagByName", body=body, cache=True)
+    
+    assert [call.path for call in manychat_stub.calls] == [
+        "/fb/subscriber/getInfo",
+        "/fb/subscriber/getInfo",
+        "/fb/subscriber/addTagByName",
+        "/fb/subscriber/addTagByName",
+    ]
+
+@pytest.mark.asyncio
+async def test_cached_requests_are_keyed_by_response_model(server_client, manychat_stub, subscriber_info_payload):
+    manychat_stub.respond("/fb/subscriber/getInfo", subscriber_info_payload)
+    
+    for model in (SuccessResponse, GetSubscriberInfoResponse, SuccessResponse):
+        result = await server_client.request(
+            "GET", "fb/subscriber/getInfo", response_model=model, cache=True
+        )
+        assert type(result) is model
+    
+    assert len(manychat_stub.calls) == 2
+
+@pytest.mark.asyncio
+async def test_expired_cache_entries_are_evicted(mock_http_client):
+    client, _, _ = mock_http_client
+    client.config.cache_ttl = 0
+    
+    for tag_name in ("a", "b", "c"):
+        await client.request("POST", "fb/subscriber/addTagByName", body={"tag_name": tag_name}, cache=True)
+    
+    assert len(client._response_cache) == 1
+
+@pytest.mark.asyncio
+async def test_only_known_endpoint_urls_are_kept(mock_http_client):
+    client, session, _ = mock_http_client
+    known = dict(client._url_cache)
+    
+    await client.request("GET", "fb/custom/endpoint")
+    await client.request("GET", "/fb/page/getInfo")
+    
+    assert session.last_call[1] == known["fb/page/getInfo"]
+    assert client._url_cache == {**known, "/fb/page/getInfo": known["fb/page/getInfo"]}
+
+def test_get_client_shares_one_client_per_api_key():
+    first = get_client(api_key="key_a")
+    
+    assert get_client(api_key="key_a") is first
+    assert get_client(api_key="key_b") is not first
+    assert first.config.api_key == "key_a"
+
+def test_shared_client_works_across_event_loops(server_config):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = server_config.model_copy(update={"base_url": f"http://127.0.0.1:{port}"})
+    client = ManyChatClient(config=config)
+    
+    async def handle(request):
+        return web.json_response({"status": "success"})
+    
+    async def call_once(close=False):
+        app = web.Application()
+        app.router.add_post("/fb/subscriber/addTagByName", handle)
+        server = TestServer(app, host="127.0.0.1", port=port)
+        await server.start_server()
+        try:
+            return await add_tag_by_name(client, subscriber_id="1", tag_name="VIP")
+        finally:
+            if close:
+                await client.close()
+            await server.close()
+    
+    # Run each loop in a worker thread so the test session's own loop is left untouched
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(asyncio.run, call_once()).result().status == "success"
+        assert pool.submit(asyncio.run, call_once(close=True)).result().status == "success"
+
+
+def test_shared_client_rejects_a_second_live_event_loop(server_config):
+    client = ManyChatClient(config=server_config)
+    started = threading.Event()
+    released = threading.Event()
+    
+    async def hold():
+        await client.start()
+        session = client._session
+        started.set()
+        await asyncio.to_thread(released.wait)
+        try:
+            return client._session is session and not session.closed
+        finally:
+            await client.close()
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(asyncio.run, hold())
+        started.wait()
+        try:
+            with pytest.raises(RuntimeError):
+                pool.submit(asyncio.run, client.start()).result()
+        finally:
+            released.set()
+        assert first.result()
@@ -3,27 +3,31 @@ from app.core.third_party_integrations.manychat.api.facebook.getInfo import get_
 from app.core.third_party_integrations.manychat.api.facebook._responses import PageInfoResponse
 
 @pytest.mark.asyncio
-async def test_get_page_info_success(mock_http_client):
-    client, mock_session, mock_response = mock_http_client
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": {
-            "id": 12345,
-            "name": "Test Page",
-            "category": "Test Category",
-            "is_pro": True
-        }
-    }
+async def test_get_page_info_success(server_client, manychat_stub, page_info_payload):
+    manychat_stub.respond("/fb/page/getInfo", page_info_payload)
     
-    result = await get_page_info(client)
+    result = await get_page_info(server_client)
     
     assert isinstance(result, PageInfoResponse)
     assert result.status == "success"
     assert result.data.id == 12345
     assert result.data.name == "Test Page"
-    mock_session.request.assert_awaited_once_with(
-        "GET",
-        "https://api.manychat.com/fb/page/getInfo",
-        headers={"Authorization": "Bearer test_api_key"},
-        json=None
-    )
\ No newline at end of file
+    (call,) = manychat_stub.calls
+    assert call.method == "GET"
+    assert call.path == "/fb/page/getInfo"
+    assert call.authorization == "Bearer test_api_key"
+    assert call.json is None
+
+@pytest.mark.asyncio
+async def test_get_page_info_is_cached(server_client, manychat_stub, page_info_payload):
+    manychat_stub.respond("/fb/page/getInfo", page_info_payload)
+    
+    first = await get_page_info(server_client)
+    second = await get_page_info(server_client)
+    
+    assert second is first
+    assert len(manychat_stub.calls) == 1
+    
+    server_client.clear_cache()
+    await get_page_info(server_client)
+    assert len(manychat_stub.calls) == 2
@@ -1,26 +1,28 @@
 import pytest
-from app.core.third_party_integrations.manychat.api.facebook.getTags import get_tags
+from app.core.third_party_integrations.manychat.api.facebook.getTags import find_tag_by_name, get_tags
 from app.core.third_party_integrations.manychat.api.facebook._responses import TagsListResponse
 
 @pytest.mark.asyncio
-async def test_get_tags_success(mock_http_client):
-    client, mock_session, mock_response = mock_http_client
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": [
-            {"id": 1, "name": "Tag 1"},
-            {"id": 2, "name": "Tag 2"}
-        ]
-    }
+async def test_get_tags_success(server_client, manychat_stub, tags_payload):
+    manychat_stub.respond("/fb/page/getTags", tags_payload)
     
-    result = await get_tags(client)
+    result = await get_tags(server_client)
     
     assert isinstance(result, TagsListResponse)
     assert result.status == "success"
     assert len(result.data) == 2
-    mock_session.request.assert_awaited_once_with(
-        "GET",
-        "https://api.manychat.com/fb/page/getTags",
-        headers={"Authorization": "Bearer test_api_key"},
-        json=None
-    )
\ No newline at end of file
+    (call,) = manychat_stub.calls
+    assert call.method == "GET"
+    assert call.path == "/fb/page/getTags"
+    assert call.authorization == "Bearer test_api_key"
+    assert call.json is None
+
+@pytest.mark.asyncio
+async def test_find_tag_by_name_reuses_tag_index(server_client, manychat_stub, tags_payload):
+    manychat_stub.respond("/fb/page/getTags", tags_payload)
+    
+    assert await find_tag_by_name(server_client, "tag 2") == {"id": 2, "name": "Tag 2"}
+    assert await find_tag_by_name(server_client, "TAG 1") == {"id": 1, "name": "Tag 1"}
+    assert await find_tag_by_name(server_client, "missing") is None
+    
+    assert len(manychat_stub.calls) == 1
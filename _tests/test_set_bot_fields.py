@@ -1,31 +1,92 @@
+import asyncio
+
 import pytest
-from app.core.third_party_integrations.manychat.api.facebook.setBotFields import set_bot_fields
+from app.core.third_party_integrations.manychat.api.facebook.setBotFields import set_bot_field, set_bot_fields
+from app.core.third_party_integrations.manychat.api._exceptions import ManyChatValidationError
 from app.core.third_party_integrations.manychat.api.facebook._responses import SetBotFieldsResponse
 
 @pytest.mark.asyncio
-async def test_set_bot_fields_success(mock_http_client):
-    client, mock_session, mock_response = mock_http_client
-    mock_response.json.return_value = {
-        "status": "success",
-        "data": [
-            {"field_id": 1, "success": True},
-            {"field_name": "test", "success": True}
-        ]
-    }
+async def test_set_bot_fields_success(server_client, manychat_stub, bot_fields_payload):
+    manychat_stub.respond("/fb/page/setBotFields", bot_fields_payload)
     
     fields = [
         {"field_id": 1, "field_value": "test"},
         {"field_name": "test", "field_value": 123}
     ]
     
-    result = await set_bot_fields(client, fields)
+    result = await set_bot_fields(server_client, fields)
     
     assert isinstance(result, SetBotFieldsResponse)
     assert result.status == "success"
     assert len(result.data) == 2
-    mock_session.request.assert_awaited_once_with(
-        "POST",
-        "https://api.manychat.com/fb/page/setBotFields",
-        headers={"Authorization": "Bearer test_api_key"},
-        json={"fields": fields}
-    )
\ No newline at end of file
+    (call,) = manychat_stub.calls
+    assert call.method == "POST"
+    assert call.path == "/fb/page/setBotFields"
+    assert call.authorization == "Bearer test_api_key"
+    assert call.json == {"fields": fields}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("field", [
+    {"field_id": "7", "field_value": 1},
+    {"field_id": 7, "field_value": 1, "junk": 1},
+    {"field_name": "", "field_value": 1},
+    {"field_id": 0, "field_value": 1},
+])
+async def test_set_bot_fields_rejects_fields_unsafe_to_send(server_client, manychat_stub, field):
+    with pytest.raises(ValueError):
+        await set_bot_fields(server_client, [field])
+    
+    assert manychat_stub.calls == []
+
+@pytest.mark.asyncio
+async def test_set_bot_fields_drops_explicit_none(server_client, manychat_stub, bot_fields_payload):
+    manychat_stub.respond("/fb/page/setBotFields", bot_fields_payload)
+    
+    await set_bot_fields(server_client, [{"field_id": 1, "field_name": None, "field_value": 5}])
+    
+    (call,) = manychat_stub.calls
+    assert call.json == {"fields": [{"field_id": 1, "field_value": 5}]}
+
+@pytest.mark.asyncio
+async def test_set_bot_fields_trusted_skips_validation(server_client, manychat_stub, bot_fields_payload):
+    manychat_stub.respond("/fb/page/setBotFields", bot_fields_payload)
+    
+    fields = [{"field_value": "no identifier"}]
+    
+    with pytest.raises(ValueError):
+        await set_bot_fields(server_client, fields)
+    result = await set_bot_fields(server_client, fields, trusted=True)
+    
+    assert result.status == "success"
+    (call,) = manychat_stub.calls
+    assert call.json == {"fields": fields}
+
+@pytest.mark.asyncio
+async def test_set_bot_field_batches_concurrent_updates(server_client, manychat_stub, bot_fields_payload):
+    manychat_stub.respond("/fb/page/setBotFields", bot_fields_payload)
+    
+    first, second = await asyncio.gather(
+        set_bot_field(server_client, field_id=1, field_value="test"),
+        set_bot_field(server_client, field_name="test", field_value=123),
+    )
+    
+    (call,) = manychat_stub.calls
+    assert call.json == {"fields": [
+        {"field_id": 1, "field_value": "test"},
+        {"field_name": "test", "field_value": 123}
+    ]}
+    assert first.data == [{"field_id": 1, "success": True}]
+    assert second.data == [{"field_name": "test", "success": True}]
+
+@pytest.mark.asyncio
+async def test_set_bot_field_batch_rejects_missing_results(server_client, manychat_stub):
+    manychat_stub.respond("/fb/page/setBotFields", b'{"status":"success","data":[]}')
+    
+    results = await asyncio.gather(
+        set_bot_field(server_client, field_id=1, field_value="test"),
+        set_bot_field(server_client, field_name="test", field_value=123),
+        return_exceptions=True,
+    )
+    
+    assert len(manychat_stub.calls) == 1
+    assert all(isinstance(result, ManyChatValidationError) for result in results)
@@ -0,0 +1,42 @@
+import pytest
+from pydantic import ValidationError
+from app.core.third_party_integrations.manychat.api._responses import SubscribersBatch
+
+RECORDS = [
+    {
+        "id": 1,
+        "status": "subscribed",
+        "first_name": "John",
+        "tags": [{"id": 7, "name": "VIP"}],
+        "created_at": "2024-01-01T00:00:00Z",
+    },
+    {
+        "id": "2",
+        "status": "unsubscribed",
+        "firstName": "Jane",
+        "createdAt": "2024-01-02T00:00:00Z",
+    },
+]
+
+def test_subscribers_batch_transposes_records_like_subscriber():
+    batch = SubscribersBatch.from_api_response({"data": RECORDS, "total": 2})
+    
+    assert len(batch) == 2
+    assert batch.ids == ["1", "2"]
+    assert batch.first_names == ["John", "Jane"]
+    assert batch.tag_ids == [["7"], []]
+    assert batch.total == 2
+    subscribers = batch.as_subscribers()
+    assert [s.id for s in subscribers] == ["1", "2"]
+    assert subscribers[0].tags[0].name == "VIP"
+
+def test_subscribers_batch_rejects_incomplete_records():
+    with pytest.raises(ValidationError, match="created_at"):
+        SubscribersBatch.from_api_response({"data": [{"id": "1", "status": "subscribed"}]})
+
+def test_subscribers_batch_trusted_response_keeps_columns():
+    batch = SubscribersBatch.from_trusted_response({"data": RECORDS})
+    
+    assert batch.ids == [1, "2"]
+    assert batch.first_names == ["John", "Jane"]
+    assert len(batch.as_subscribers()) == 2
@@ -1,49 +1,152 @@
 """Base models and utilities for ManyChat API interactions."""
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, Optional, TypeVar, Union
-from pydantic import BaseModel, Field
+from functools import cached_property, lru_cache
+import types
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union, get_args, get_origin
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from ._exceptions import ManyChatAPIError
 
 T = TypeVar('T', bound='BaseModel')
 
+# BaseRequest values cached in the instance __dict__, derived from its fields
+_CACHED_PROPERTIES = ("as_json_bytes", "as_params")
+
+
+@lru_cache(maxsize=None)
+def _adapter(cls: type) -> TypeAdapter:
+    """Return the shared TypeAdapter for a response model class."""
+    return TypeAdapter(cls)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Build a trusted field value, constructing any nested models it holds."""
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        (item_type,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_type, item) for item in value]
+    if origin is Union or origin is types.UnionType:
+        for arg in get_args(annotation):
+            if isinstance(arg, type) and issubclass(arg, BaseModel) and isinstance(value, dict):
+                return _construct_nested(arg, value)
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, dict):
+        return _construct_nested(annotation, value)
+    return value
+
+
+def _construct_nested(model: type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """Build ``model`` from trusted data with ``model_construct``, skipping validation.
+    
+    Nested model fields (including lists and optionals of models) are
+    constructed recursively; other values are used as-is.
+    """
+    values = {}
+    for name, field in model.model_fields.items():
+        key = field.alias if field.alias in data else name
+        if key in data:
+            values[name] = _construct_value(field.annotation, data[key])
+    return model.model_construct(**values)
+
 
-class APIError(Exception):
-    """Base exception for all API-related errors."""
-    def __init__(self, message: str, status_code: Optional[int] = None, 
-                 raw_response: Optional[Dict[str, Any]] = None):
-        self.status_code = status_code
-        self.raw_response = raw_response
-        super().__init__(message)
+# Kept for backwards compatibility; API errors use the ManyChatError hierarchy
+APIError = ManyChatAPIError
 
 
-class BaseRequest(BaseModel, ABC):
-    """Base class for all API request models."""
+class BaseRequest(BaseModel):
+    """Base class for all API request models.
     
-    class Config:
-        json_encoders = {
-            # Add custom JSON encoders here if needed
-        }
-        extra = "forbid"  # Reject extra fields
+    Requests are immutable once built, so derived values such as the
+    serialized body can be cached and reused across retries. Schemas are
+    built on first use, so request classes that are never instantiated
+    (such as empty placeholders) cost nothing at import.
+    """
+    
+    model_config = ConfigDict(
+        extra="forbid",  # Reject extra fields
+        populate_by_name=True,
+        frozen=True,
+        defer_build=True,
+    )
         
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'BaseRequest':
+        """Copy the request, dropping cached values so they match the copy's fields."""
+        copy = super().model_copy(update=update, deep=deep)
+        for name in _CACHED_PROPERTIES:
+            copy.__dict__.pop(name, None)
+        return copy
+    
     def to_api_format(self) -> Dict[str, Any]:
         """Convert the model to the format expected by the API."""
-        return self.dict(exclude_none=True)
+        return self.model_dump(exclude_none=True, mode="json")
+    
+    @cached_property
+    def as_json_bytes(self) -> bytes:
+        """The request serialized to a JSON body, computed once."""
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+    
+    @cached_property
+    def as_params(self) -> Dict[str, Any]:
+        """The request as query string parameters keyed by alias, computed once."""
+        return self.model_dump(exclude_none=True, by_alias=True, mode="json")
+    
+    @classmethod
+    def compile_builder(cls) -> Callable[..., Dict[str, Any]]:
+        """Compile a function that builds this request's body without validation.
+        
+        The generated function takes the model's fields as positional
+        arguments, in declaration order, and returns a dict keyed by field
+        alias. Only fixed-shape requests (all fields required) are supported.
+        """
+        fields = cls.model_fields
+        optional = [name for name, field in fields.items() if not field.is_required()]
+        if optional:
+            raise TypeError(
+                f"{cls.__name__} has optional fields: {', '.join(optional)}"
+            )
+        items = ", ".join(f"{(field.alias or name)!r}: {name}" for name, field in fields.items())
+        source = f"def build({', '.join(fields)}):\n    return {{{items}}}\n"
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, f"<{cls.__name__}.compile_builder>", "exec"), namespace)
+        return namespace["build"]
 
 
-class BaseResponse(BaseModel, Generic[T], ABC):
+class BaseResponse(BaseModel, Generic[T]):
     """Base class for all API response models."""
     
-    class Config:
-        json_encoders = {
-            # Add custom JSON encoders here if needed
-        }
-        extra = "ignore"  # Be permissive with extra fields from API
+    model_config = ConfigDict(
+        extra="ignore",  # Be permissive with extra fields from API
+    )
     
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'BaseResponse[T]':
         """Create a response model from API response data."""
-        return cls.parse_obj(data)
+        return _adapter(cls).validate_python(data)
+    
+    @classmethod
+    def from_api_bytes(cls, raw: Union[bytes, str]) -> 'BaseResponse[T]':
+        """Create a response model directly from a raw JSON response body."""
+        return _adapter(cls).validate_json(raw)
+    
+    @classmethod
+    def from_trusted_response(cls, data: Dict[str, Any]) -> 'BaseResponse[T]':
+        """Create a response model from trusted API data without validation.
+        
+        Only the shape of the top level is checked: it must be an object
+        holding every required field.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Response body is not a JSON object")
+        missing = [
+            name for name, field in cls.model_fields.items()
+            if field.is_required() and name not in data and field.alias not in data
+        ]
+        if missing:
+            raise ValueError(f"Response is missing required fields: {', '.join(missing)}")
+        return _construct_nested(cls, data)
 
 
 class PaginatedResponse(BaseResponse[T]):
@@ -74,10 +177,10 @@ class ErrorResponse(BaseModel):
     def raise_for_status(self):
         """Raise an appropriate exception based on the error response."""
         if self.status == "error":
-            raise APIError(
-                message=self.message,
+            raise ManyChatAPIError(
+                self.message,
                 status_code=self.code,
-                raw_response=self.dict()
+                response=self.model_dump()
             )
 
 
@@ -91,7 +194,23 @@ class SuccessResponse(BaseResponse[T]):
         """Create a success response from API data."""
         if data.get("status") != "success":
             raise ValueError("Not a success response")
-        return cls.parse_obj(data)
+        return _adapter(cls).validate_python(data)
+    
+    @classmethod
+    def from_api_bytes(cls, raw: Union[bytes, str]) -> 'SuccessResponse[T]':
+        """Create a success response from a raw JSON response body."""
+        response = _adapter(cls).validate_json(raw)
+        if response.status != "success":
+            raise ValueError("Not a success response")
+        return response
+    
+    @classmethod
+    def from_trusted_response(cls, data: Dict[str, Any]) -> 'SuccessResponse[T]':
+        """Create a success response from trusted API data without validation."""
+        response = super().from_trusted_response(data)
+        if response.status != "success":
+            raise ValueError("Not a success response")
+        return response
 
 
 class EmptyResponse(SuccessResponse[None]):
@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional
 
 class ManyChatError(Exception):
     """Base exception for all ManyChat API errors."""
+    __slots__ = ("status_code", "response", "request_id")
+
     def __init__(
         self,
         message: str,
@@ -19,6 +21,8 @@ class ManyChatError(Exception):
 
 class ManyChatAPIError(ManyChatError):
     """Raised when the ManyChat API returns an error response."""
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -33,12 +37,16 @@ class ManyChatAPIError(ManyChatError):
 
 class ManyChatAuthError(ManyChatError):
     """Raised when authentication fails or access is denied."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(message, status_code=401)
 
 
 class ManyChatRateLimitError(ManyChatError):
     """Raised when the rate limit is exceeded."""
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -52,41 +60,55 @@ class ManyChatRateLimitError(ManyChatError):
 
 class ManyChatValidationError(ManyChatError):
     """Raised when request validation fails."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Validation failed"):
         super().__init__(message, status_code=400)
 
 
 class ManyChatNotFoundError(ManyChatError):
     """Raised when a requested resource is not found."""
+    __slots__ = ()
+
     def __init__(self, resource: str = "Resource"):
         super().__init__(f"{resource} not found", status_code=404)
 
 
 class ManyChatConflictError(ManyChatError):
     """Raised when there's a conflict with the current state."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Conflict with current state"):
         super().__init__(message, status_code=409)
 
 
 class ManyChatServerError(ManyChatError):
     """Raised when the ManyChat server encounters an error."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Internal server error"):
         super().__init__(message, status_code=500)
 
 
 class ManyChatTimeoutError(ManyChatError):
     """Raised when a request times out."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Request timed out"):
         super().__init__(message)
 
 
 class ManyChatConnectionError(ManyChatError):
     """Raised when there are connection issues."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Connection error"):
         super().__init__(message)
 
 
 class ManyChatRetryError(ManyChatError):
     """Raised when a request should be retried."""
+    __slots__ = ()
+
     def __init__(self, message: str = "Request should be retried"):
         super().__init__(message)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Shared data models for ManyChat API.
+
+This module contains the canonical Pydantic models for entities that appear
+in both requests and responses. ``_requests.py`` and ``_responses.py``
+re-export them.
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic.alias_generators import to_camel
+
+from app.core.third_party_integrations.manychat.api._enums import (
+    FieldType,
+    SubscriberGender,
+    SubscriberStatus,
+)
+
+# Accept both the API's snake_case keys and camelCase, and numeric IDs for
+# string ID fields
+_MODEL_CONFIG = ConfigDict(
+    alias_generator=to_camel,
+    populate_by_name=True,
+    coerce_numbers_to_str=True,
+)
+
+class SubscriberField(BaseModel):
+    """Model for a single custom field value for a subscriber."""
+    model_config = _MODEL_CONFIG
+
+    id: str = Field(..., description="Unique identifier for the field")
+    name: str = Field(..., description="Name of the field")
+    type: FieldType = Field(..., description="Type of the field")
+    description: Optional[str] = Field(None, description="Description of the field")
+    value: Optional[Any] = Field(None, description="Value of the field")
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class Tag(BaseModel):
+    """Model for a tag in ManyChat."""
+    model_config = _MODEL_CONFIG
+
+    id: str = Field(..., description="Unique identifier for the tag")
+    name: str = Field(..., description="Name of the tag")
+    description: Optional[str] = Field(None, description="Description of the tag")
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class Subscriber(BaseModel):
+    """Model representing a subscriber in ManyChat."""
+    model_config = _MODEL_CONFIG
+
+    id: str = Field(..., description="Unique identifier for the subscriber")
+    status: SubscriberStatus = Field(..., description="Subscription status")
+    first_name: Optional[str] = Field(None, description="First name of the subscriber")
+    last_name: Optional[str] = Field(None, description="Last name of the subscriber")
+    name: Optional[str] = Field(None, description="Full name of the subscriber")
+    gender: Optional[SubscriberGender] = Field(None, description="Gender of the subscriber")
+    profile_pic: Optional[HttpUrl] = Field(None, description="URL to the subscriber's profile picture")
+    locale: Optional[str] = Field(None, description="Locale of the subscriber")
+    language: Optional[str] = Field(None, description="Language preference")
+    timezone: Optional[int] = Field(None, description="Timezone offset in seconds")
+    last_input_text: Optional[str] = Field(None, description="Last input text from the subscriber")
+    last_user_text: Optional[str] = Field(None, description="Last text sent by the subscriber")
+    last_interaction: Optional[datetime] = Field(None, description="Timestamp of last interaction")
+    last_seen: Optional[datetime] = Field(None, description="When the subscriber was last seen online")
+    subscribed: bool = Field(False, description="Whether the subscriber is currently subscribed")
+    user_phone: Optional[str] = Field(None, description="User's phone number")
+    whatsapp_phone: Optional[str] = Field(None, description="WhatsApp phone number")
+    whatsapp_phone_id: Optional[str] = Field(None, description="WhatsApp phone number ID")
+    phone_number: Optional[str] = Field(None, description="Primary phone number")
+    email: Optional[str] = Field(None, description="Email address")
+    utm_campaign: Optional[str] = None
+    utm_content: Optional[str] = None
+    utm_medium: Optional[str] = None
+    utm_source: Optional[str] = None
+    utm_term: Optional[str] = None
+    tags: List[Tag] = Field(default_factory=list, description="List of tags associated with the subscriber")
+    custom_fields: List[SubscriberField] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("custom_fields", "customFields", "fields"),
+        description="List of custom field values for the subscriber"
+    )
+    created_at: datetime = Field(..., description="When the subscriber was created")
+    updated_at: Optional[datetime] = Field(None, description="When the subscriber was last updated")
+
+    # Validator to handle empty profile pic URLs
+    @field_validator('profile_pic', mode='before')
+    @classmethod
+    def validate_profile_pic(cls, v):
+        if v == "":
+            return None
+        return v
@@ -6,109 +6,33 @@ returned by the ManyChat API endpoints.
 """
 
 from datetime import datetime
-from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
+from pydantic.alias_generators import to_camel
 
 from app.core.third_party_integrations.manychat.api._base import (
     BaseResponse,
     ErrorResponse,
     PaginatedResponse,
     SuccessResponse,
+    _adapter,
+)
+from app.core.third_party_integrations.manychat.api._enums import (
+    FieldType,
+    SubscriberGender,
+    SubscriberSource,
+    SubscriberStatus,
+)
+from app.core.third_party_integrations.manychat.api._models import (
+    Subscriber,
+    SubscriberField,
+    Tag,
 )
 
 # Type variable for generic response models
 T = TypeVar('T')
 
-class SubscriberStatus(str, Enum):
-    """Possible status values for a subscriber."""
-    SUBSCRIBED = "subscribed"
-    UNSUBSCRIBED = "unsubscribed"
-    PENDING = "pending"
-
-class SubscriberGender(str, Enum):
-    """Possible gender values for a subscriber."""
-    MALE = "male"
-    FEMALE = "female"
-    UNKNOWN = "unknown"
-
-class SubscriberSource(str, Enum):
-    """Possible sources for a subscriber."""
-    FACEBOOK = "facebook"
-    WHATSAPP = "whatsapp"
-    INSTAGRAM = "instagram"
-    WEB_CHAT = "web_chat"
-    CUSTOM = "custom"
-
-class FieldType(str, Enum):
-    """Possible field types in ManyChat."""
-    TEXT = "Text"
-    NUMBER = "Number"
-    DATE = "Date"
-    DATETIME = "DateTime"
-    BOOLEAN = "Boolean"
-    URL = "URL"
-    EMAIL = "Email"
-    PHONE = "Phone"
-    COUNTRY = "Country"
-    STATE = "State"
-    CITY = "City"
-    ZIP = "ZIP"
-    CURRENCY = "Currency"
-
-class SubscriberField(BaseModel):
-    """Model for a single custom field value for a subscriber."""
-    id: str = Field(..., description="Unique identifier for the field")
-    name: str = Field(..., description="Name of the field")
-    type: FieldType = Field(..., description="Type of the field")
-    value: Optional[Any] = Field(None, description="Value of the field")
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-class Tag(BaseModel):
-    """Model for a tag in ManyChat."""
-    id: str = Field(..., description="Unique identifier for the tag")
-    name: str = Field(..., description="Name of the tag")
-    description: Optional[str] = Field(None, description="Description of the tag")
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-class Subscriber(BaseModel):
-    """Model representing a subscriber in ManyChat."""
-    id: str = Field(..., description="Unique identifier for the subscriber")
-    status: SubscriberStatus = Field(..., description="Subscription status")
-    first_name: Optional[str] = Field(None, description="First name of the subscriber")
-    last_name: Optional[str] = Field(None, description="Last name of the subscriber")
-    name: Optional[str] = Field(None, description="Full name of the subscriber")
-    gender: Optional[SubscriberGender] = Field(None, description="Gender of the subscriber")
-    profile_pic: Optional[HttpUrl] = Field(None, description="URL to the subscriber's profile picture")
-    locale: Optional[str] = Field(None, description="Locale of the subscriber")
-    language: Optional[str] = Field(None, description="Language preference")
-    timezone: Optional[int] = Field(None, description="Timezone offset in seconds")
-    last_input_text: Optional[str] = Field(None, description="Last input text from the subscriber")
-    last_interaction: Optional[datetime] = Field(None, description="Timestamp of last interaction")
-    last_seen: Optional[datetime] = Field(None, description="When the subscriber was last seen online")
-    subscribed: bool = Field(False, description="Whether the subscriber is currently subscribed")
-    user_phone: Optional[str] = Field(None, description="User's phone number")
-    whatsapp_phone: Optional[str] = Field(None, description="WhatsApp phone number")
-    phone_number: Optional[str] = Field(None, description="Primary phone number")
-    email: Optional[str] = Field(None, description="Email address")
-    tags: List[Tag] = Field(default_factory=list, description="List of tags associated with the subscriber")
-    custom_fields: List[SubscriberField] = Field(
-        default_factory=list,
-        description="List of custom field values for the subscriber"
-    )
-    created_at: datetime = Field(..., description="When the subscriber was created")
-    updated_at: Optional[datetime] = Field(None, description="When the subscriber was last updated")
-
-    # Validator to handle empty profile pic URLs
-    @validator('profile_pic', pre=True)
-    def validate_profile_pic(cls, v):
-        if v == "":
-            return None
-        return v
-
 # Response models for different API endpoints
 class SubscriberResponse(SuccessResponse):
     """Response model for subscriber-related endpoints."""
@@ -118,6 +42,91 @@ class SubscribersResponse(PaginatedResponse):
     """Response model for paginated list of subscribers."""
     data: List[Subscriber] = Field(..., description="List of subscribers")
 
+def _record_value(record: Dict[str, Any], name: str, required: bool = False) -> Any:
+    """Read a field by name or camelCase alias, as ``Subscriber`` accepts it."""
+    if name in record:
+        return record[name]
+    alias = to_camel(name)
+    if alias in record:
+        return record[alias]
+    if required:
+        raise ValueError(f"Subscriber record is missing {name!r}")
+    return None
+
+
+def _transpose_subscribers(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a list-of-records response into the ``SubscribersBatch`` columns."""
+    records = data.get("data") or []
+    if not all(isinstance(record, dict) for record in records):
+        raise ValueError("Subscriber records must be objects")
+    columns = {key: value for key, value in data.items() if key != "data"}
+    columns.update(
+        records=records,
+        ids=[_record_value(record, "id", required=True) for record in records],
+        statuses=[_record_value(record, "status", required=True) for record in records],
+        names=[_record_value(record, "name") for record in records],
+        first_names=[_record_value(record, "first_name") for record in records],
+        last_names=[_record_value(record, "last_name") for record in records],
+        emails=[_record_value(record, "email") for record in records],
+        tag_ids=[
+            [_record_value(tag, "id", required=True) for tag in _record_value(record, "tags") or ()]
+            for record in records
+        ],
+        created_at=[_record_value(record, "created_at", required=True) for record in records],
+    )
+    return columns
+
+
+class SubscribersBatch(BaseResponse):
+    """Column-oriented response model for high-volume subscriber listings.
+
+    The API's list of subscriber objects is transposed once into parallel
+    lists, so no ``Subscriber`` model is built per record. Records are read
+    with the same keys and ID coercion as ``Subscriber``. Use
+    ``as_subscribers()`` to materialize full models when needed.
+    """
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    ids: List[str] = Field(default_factory=list, description="Subscriber IDs")
+    statuses: List[SubscriberStatus] = Field(default_factory=list, description="Subscription statuses")
+    names: List[Optional[str]] = Field(default_factory=list, description="Full names")
+    first_names: List[Optional[str]] = Field(default_factory=list, description="First names")
+    last_names: List[Optional[str]] = Field(default_factory=list, description="Last names")
+    emails: List[Optional[str]] = Field(default_factory=list, description="Email addresses")
+    tag_ids: List[List[str]] = Field(default_factory=list, description="Tag IDs per subscriber")
+    created_at: List[datetime] = Field(default_factory=list, description="Creation timestamps")
+    records: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        exclude=True,
+        repr=False,
+        description="Raw subscriber records backing as_subscribers()"
+    )
+    total: int = 0
+    page: int = 1
+    limit: int = 10
+    has_more: bool = False
+
+    @model_validator(mode='before')
+    @classmethod
+    def transpose_records(cls, data):
+        if not isinstance(data, dict) or "data" not in data:
+            return data
+        return _transpose_subscribers(data)
+
+    @classmethod
+    def from_trusted_response(cls, data: Dict[str, Any]) -> 'SubscribersBatch':
+        """Transpose trusted API data into columns without validating them."""
+        if not isinstance(data, dict):
+            raise ValueError("Response body is not a JSON object")
+        return cls.model_construct(**_transpose_subscribers(data))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def as_subscribers(self) -> List[Subscriber]:
+        """Build full ``Subscriber`` models from the underlying records."""
+        return [Subscriber.model_validate(record) for record in self.records]
+
 class TagResponse(SuccessResponse):
     """Response model for tag-related endpoints."""
     data: Tag = Field(..., description="Tag data")
@@ -192,4 +201,25 @@ CustomFieldId = str
 FlowId = str
 BroadcastId = str
 TemplateId = str
-WebhookId = str
\ No newline at end of file
+WebhookId = str
+
+# Build the shared adapters at import time so the first API call validates
+# as fast as every later one
+for _model in (
+    SuccessResponse,
+    SubscriberResponse,
+    SubscribersResponse,
+    SubscribersBatch,
+    TagResponse,
+    TagsResponse,
+    CustomFieldResponse,
+    CustomFieldsResponse,
+    FlowResponse,
+    BroadcastResponse,
+    ContentTemplateResponse,
+    ContentTemplatesResponse,
+    WebhookResponse,
+    WebhooksResponse,
+):
+    _adapter(_model)
+del _model
@@ -0,0 +1,32 @@
+"""ManyChat Facebook page API endpoints.
+
+Endpoint functions are imported on first access (PEP 562), so importing this
+package does not load every endpoint module and its response models.
+"""
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    "get_page_info": ".getInfo",
+    "get_tags": ".getTags",
+    "find_tag_by_name": ".getTags",
+    "set_bot_fields": ".setBotFields",
+    "set_bot_field": ".setBotFields",
+    "BotFieldsBatcher": ".setBotFields",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
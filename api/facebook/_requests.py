@@ -1,11 +1,17 @@
 # In _requests.py
-from typing import List, Optional, Union
-from pydantic import BaseModel, Field, validator
-from app.core.third_party_integrations.manychat.api._requests import BaseRequest
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+from app.core.third_party_integrations.manychat.api._base import BaseRequest
 
 
 class BotFieldUpdate(BaseModel):
-    """Model for updating a single bot field."""
+    """Model for updating a single bot field.
+
+    Validation is strict and rejects unknown keys, so values are never
+    coerced into something the caller did not send.
+    """
+    model_config = ConfigDict(strict=True, extra="forbid")
+
     field_id: Optional[int] = Field(
         None,
         description="ID of the field to update (either field_id or field_name must be provided)"
@@ -19,16 +25,33 @@ class BotFieldUpdate(BaseModel):
         description="Value to set for the field"
     )
 
-    @validator('field_name', always=True)
-    def validate_field_identifier(cls, v, values):
-        if not v and not values.get('field_id'):
+    @model_validator(mode='after')
+    def validate_field_identifier(self):
+        if not self.field_name and not self.field_id:
             raise ValueError("Either field_id or field_name must be provided")
-        return v
+        return self
+
+# Validates a whole list of field updates in one call
+_FIELDS_ADAPTER = TypeAdapter(List[BotFieldUpdate])
 
 class SetBotFieldsRequest(BaseRequest):
-    """Request model for setting multiple bot fields."""
-    fields: List[BotFieldUpdate] = Field(
+    """Request model for setting multiple bot fields.
+
+    ``fields`` is validated as ``BotFieldUpdate`` items in a single pass on
+    construction and stored as plain dicts without unset (``None``) keys.
+    """
+    fields: List[Dict[str, Any]] = Field(
         ...,
-        max_items=20,
+        max_length=20,
         description="List of fields to update (max 20 per request)"
-    )
\ No newline at end of file
+    )
+
+    @field_validator('fields')
+    @classmethod
+    def validate_fields(cls, v):
+        return _FIELDS_ADAPTER.dump_python(_FIELDS_ADAPTER.validate_python(v), exclude_none=True)
+
+    @property
+    def validated_fields(self) -> List[BotFieldUpdate]:
+        """The field updates as ``BotFieldUpdate`` models."""
+        return _FIELDS_ADAPTER.validate_python(self.fields)
\ No newline at end of file
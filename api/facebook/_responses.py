@@ -1,17 +1,19 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing_extensions import Annotated, NotRequired, TypedDict
 
 from app.core.third_party_integrations.manychat.api._responses import (
     SuccessResponse,
 )
-from app.core.third_party_integrations.manychat.api._enums import HttpUrl
 
 
 # In _responses.py
 class PageInfo(BaseModel):
     """Model representing page information in ManyChat."""
+    model_config = ConfigDict(defer_build=True)
+
     id: int = Field(..., description="Page ID")
     name: str = Field(..., description="Page name")
     category: str = Field(..., description="Page category")
@@ -24,28 +26,34 @@ class PageInfo(BaseModel):
 
 class PageInfoResponse(SuccessResponse):
     """Response model for page information endpoint."""
+    model_config = ConfigDict(defer_build=True)
+
     data: PageInfo = Field(..., description="Page information data")
     
 # In _responses.py
-class TagInfo(BaseModel):
+class TagInfo(TypedDict):
     """Model representing a tag in ManyChat."""
-    id: int = Field(..., description="Tag ID")
-    name: str = Field(..., description="Tag name")
+    id: Annotated[int, Field(description="Tag ID")]
+    name: Annotated[str, Field(description="Tag name")]
 
 class TagsListResponse(SuccessResponse):
     """Response model for tags list endpoint."""
+    model_config = ConfigDict(defer_build=True)
+
     data: list[TagInfo] = Field(..., description="List of tags")
     
 # In _responses.py
-class BotFieldUpdateResult(BaseModel):
+class BotFieldUpdateResult(TypedDict):
     """Result of a single field update operation."""
-    field_id: Optional[int] = Field(None, description="ID of the updated field")
-    field_name: Optional[str] = Field(None, description="Name of the updated field")
-    success: bool = Field(..., description="Whether the update was successful")
-    error: Optional[str] = Field(None, description="Error message if update failed")
+    field_id: NotRequired[Annotated[Optional[int], Field(description="ID of the updated field")]]
+    field_name: NotRequired[Annotated[Optional[str], Field(description="Name of the updated field")]]
+    success: Annotated[bool, Field(description="Whether the update was successful")]
+    error: NotRequired[Annotated[Optional[str], Field(description="Error message if update failed")]]
 
 class SetBotFieldsResponse(SuccessResponse):
     """Response model for setBotFields endpoint."""
+    model_config = ConfigDict(defer_build=True)
+
     data: list[BotFieldUpdateResult] = Field(
         ...,
         description="Results of each field update operation"
@@ -5,9 +5,7 @@ This module provides an interface to interact with the ManyChat Facebook Page AP
 specifically for retrieving page information.
 """
 
-from app.core.third_party_integrations.manychat.api._requests import (
-    BaseRequest,
-)
+from app.core.third_party_integrations.manychat.api._base import BaseRequest
 from app.core.third_party_integrations.manychat.api.facebook._responses import (
     PageInfoResponse,
 )
@@ -31,7 +29,8 @@ async def get_page_info(
     Retrieve information about the Facebook page.
     
     This endpoint returns details about the page including its name, category,
-    avatar link, and other metadata.
+    avatar link, and other metadata. The response is cached on the client for
+    ``cache_ttl`` seconds.
     
     Args:
         client: An authenticated ManyChatClient instance.
@@ -47,14 +46,15 @@ async def get_page_info(
     response = await client.request(
         method="GET",
         endpoint="fb/page/getInfo",
-        response_model=PageInfoResponse
+        response_model=PageInfoResponse,
+        cache=True,
     )
     return response
 
 
 # Example usage:
 # async def example():
-#     client = ManyChatClient(api_key="your_api_key")
+#     client = get_client(api_key="your_api_key")
 #     try:
 #         page_info = await get_page_info(client)
 #         print(f"Page Name: {page_info.data.name}")
@@ -5,12 +5,21 @@ This module provides an interface to interact with the ManyChat Tags API,
 specifically for retrieving available tags.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
-from app.core.third_party_integrations.manychat.api.facebook._base import BaseRequest
-from app.core.third_party_integrations.manychat.api.facebook._responses import TagsListResponse
+from app.core.third_party_integrations.manychat.api._base import BaseRequest
+from app.core.third_party_integrations.manychat.api.facebook._responses import (
+    TagInfo,
+    TagsListResponse,
+)
 from app.core.third_party_integrations.manychat.client import ManyChatClient
 
+# Per-client tag lookup index: (tags response, {lowercased tag name: tag})
+_TAG_INDEXES: "WeakKeyDictionary[ManyChatClient, Tuple[TagsListResponse, Dict[str, TagInfo]]]" = (
+    WeakKeyDictionary()
+)
+
 
 class GetTagsRequest(BaseRequest):
     """
@@ -29,6 +38,7 @@ async def get_tags(
     Retrieve all available tags for the page.
     
     This endpoint returns a list of all tags that have been created in the page.
+    The response is cached on the client for ``cache_ttl`` seconds.
     
     Args:
         client: An authenticated ManyChatClient instance.
@@ -44,11 +54,25 @@ async def get_tags(
     response = await client.request(
         method="GET",
         endpoint="fb/page/getTags",
-        response_model=TagsListResponse
+        response_model=TagsListResponse,
+        cache=True,
     )
     return response
 
 
+async def _tag_index(client: ManyChatClient) -> Dict[str, TagInfo]:
+    """Return the name index of the client's tags, rebuilt when ``get_tags`` refetches."""
+    response = await get_tags(client)
+    entry = _TAG_INDEXES.get(client)
+    if entry is None or entry[0] is not response:
+        index: Dict[str, TagInfo] = {}
+        for tag in response.data or ():
+            index.setdefault(tag["name"].lower(), tag)
+        entry = (response, index)
+        _TAG_INDEXES[client] = entry
+    return entry[1]
+
+
 async def find_tag_by_name(
     client: ManyChatClient,
     tag_name: str
@@ -56,6 +80,9 @@ async def find_tag_by_name(
     """
     Find a tag by its name (case-insensitive).
     
+    Uses the cached ``get_tags`` response, indexed by lowercased name, so
+    repeated lookups within ``cache_ttl`` seconds don't hit the API.
+    
     Args:
         client: An authenticated ManyChatClient instance.
         tag_name: The name of the tag to find.
@@ -63,24 +90,19 @@ async def find_tag_by_name(
     Returns:
         The tag info if found, None otherwise.
     """
-    response = await get_tags(client)
-    if response.data:
-        return next(
-            (tag.dict() for tag in response.data if tag.name.lower() == tag_name.lower()),
-            None
-        )
-    return None
+    tag = (await _tag_index(client)).get(tag_name.lower())
+    return dict(tag) if tag is not None else None
 
 
 # Example usage:
 # async def example():
-#     client = ManyChatClient(api_key="your_api_key")
+#     client = get_client(api_key="your_api_key")
 #     try:
 #         # Get all tags
 #         tags_response = await get_tags(client)
 #         print(f"Found {len(tags_response.data)} tags")
 #         for tag in tags_response.data:
-#             print(f"Tag: {tag.name} (ID: {tag.id})")
+#             print(f"Tag: {tag['name']} (ID: {tag['id']})")
 #             
 #         # Find a specific tag
 #         tag = await find_tag_by_name(client, "VIP")
@@ -5,21 +5,29 @@ This module provides an interface to interact with the ManyChat Bot Fields API,
 specifically for updating bot fields.
 """
 
-from typing import Optional, Union, Any
+import asyncio
+import contextlib
+from typing import Any, List, Optional, Tuple, Union
 
+from app.core.third_party_integrations.manychat.api._exceptions import ManyChatValidationError
 from app.core.third_party_integrations.manychat.api.facebook._requests import (
+    BotFieldUpdate,
     SetBotFieldsRequest,
-    BotFieldUpdate
 )
 from app.core.third_party_integrations.manychat.api.facebook._responses import (
     SetBotFieldsResponse
 )
 from app.core.third_party_integrations.manychat.client import ManyChatClient
 
+# setBotFields accepts at most this many fields per request
+MAX_FIELDS_PER_REQUEST = 20
+
 
 async def set_bot_fields(
     client: ManyChatClient,
-    fields: list[dict[str, Any]]
+    fields: list[dict[str, Any]],
+    *,
+    trusted: bool = False
 ) -> SetBotFieldsResponse:
     """
     Update multiple bot fields in a single request.
@@ -31,6 +39,8 @@ async def set_bot_fields(
                - field_name (str, optional): Name of the field to update
                - field_value: Value to set for the field (str, int, bool, or float)
                Note: Either field_id or field_name must be provided for each field.
+        trusted: Skip validating ``fields``; only for updates that were
+                 already validated or built by the caller's own code.
         
     Returns:
         SetBotFieldsResponse containing the results of each update operation.
@@ -41,11 +51,11 @@ async def set_bot_fields(
         ManyChatRateLimitError: If rate limit is exceeded.
         ValueError: If validation of fields fails.
     """
-    # Convert dicts to BotFieldUpdate models for validation
-    field_updates = [BotFieldUpdate(**field) for field in fields]
-    
-    # Create and validate the request
-    request = SetBotFieldsRequest(fields=field_updates)
+    # Create and validate the request (all fields in one pass)
+    if trusted:
+        request = SetBotFieldsRequest.model_construct(fields=fields)
+    else:
+        request = SetBotFieldsRequest(fields=fields)
     
     # Make the API call
     response = await client.request(
@@ -57,6 +67,101 @@ async def set_bot_fields(
     return response
 
 
+class BotFieldsBatcher:
+    """
+    Coalesce single bot field updates into batched setBotFields requests.
+
+    Updates submitted within ``flush_ms`` of the first queued one are sent
+    together, up to ``max_batch`` (at most ``MAX_FIELDS_PER_REQUEST``) per
+    request. Each caller gets a
+    ``SetBotFieldsResponse`` holding only its own result; if the batched
+    request fails, every caller in that batch receives the error.
+    """
+
+    def __init__(
+        self,
+        client: ManyChatClient,
+        *,
+        max_batch: int = MAX_FIELDS_PER_REQUEST,
+        flush_ms: float = 5.0,
+    ):
+        self._client = client
+        self._max_batch = max(1, min(max_batch, MAX_FIELDS_PER_REQUEST))
+        self._flush_delay = flush_ms / 1000
+        self._queue: "asyncio.Queue[Tuple[BotFieldUpdate, asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, update: BotFieldUpdate) -> SetBotFieldsResponse:
+        """Queue one validated field update and wait for its batch to be sent."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((update, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return await future
+
+    async def aclose(self) -> None:
+        """Stop the worker and cancel updates that have not been sent."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self._flush_delay
+            while len(batch) < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[BotFieldUpdate, asyncio.Future]]) -> None:
+        fields = [update.model_dump(exclude_none=True) for update, _ in batch]
+        try:
+            response = await set_bot_fields(self._client, fields, trusted=True)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        if len(response.data or ()) != len(batch):
+            self._fail(batch, ManyChatValidationError(
+                f"setBotFields returned {len(response.data or ())} results "
+                f"for {len(batch)} fields"
+            ))
+            return
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(SetBotFieldsResponse.model_construct(
+                    status=response.status,
+                    data=response.data[index:index + 1],
+                ))
+
+    @staticmethod
+    def _fail(batch: List[Tuple[BotFieldUpdate, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+
+def _batcher_for(client: ManyChatClient) -> BotFieldsBatcher:
+    client._bind_loop()
+    if client._bot_fields_batcher is None:
+        client._bot_fields_batcher = BotFieldsBatcher(client)
+    return client._bot_fields_batcher
+
+
 async def set_bot_field(
     client: ManyChatClient,
     *,
@@ -67,6 +172,9 @@ async def set_bot_field(
     """
     Update a single bot field.
     
+    Concurrent calls on the same client are batched into one setBotFields
+    request (see ``BotFieldsBatcher``).
+    
     Args:
         client: An authenticated ManyChatClient instance.
         field_id: ID of the field to update (either field_id or field_name must be provided).
@@ -77,24 +185,20 @@ async def set_bot_field(
         SetBotFieldsResponse containing the result of the update operation.
         
     Raises:
-        ValueError: If neither field_id nor field_name is provided.
+        ValueError: If neither field_id nor field_name is provided, or the
+            update is otherwise invalid.
     """
-    if field_id is None and field_name is None:
-        raise ValueError("Either field_id or field_name must be provided")
-        
-    return await set_bot_fields(
-        client=client,
-        fields=[{
-            **({"field_id": field_id} if field_id is not None else {}),
-            **({"field_name": field_name} if field_name is not None else {}),
-            "field_value": field_value
-        }]
+    update = BotFieldUpdate(
+        field_id=field_id,
+        field_name=field_name,
+        field_value=field_value
     )
+    return await _batcher_for(client).submit(update)
 
 
 # Example usage:
 # async def example():
-#     client = ManyChatClient(api_key="your_api_key")
+#     client = get_client(api_key="your_api_key")
 #     try:
 #         # Update multiple fields
 #         response = await set_bot_fields(
@@ -104,7 +208,7 @@ async def set_bot_field(
 #                 {"field_name": "count", "field_value": 12}
 #             ]
 #         )
-#         print(f"Updated {sum(1 for r in response.data if r.success)} fields successfully")
+#         print(f"Updated {sum(1 for r in response.data if r['success'])} fields successfully")
 #         
 #         # Update a single field by name
 #         response = await set_bot_field(
@@ -0,0 +1,29 @@
+"""ManyChat subscriber API endpoints.
+
+Endpoint functions are imported on first access (PEP 562), so importing this
+package does not load every endpoint module and its response models.
+"""
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    "get_subscriber_info": ".getInfo",
+    "add_tag_by_name": ".addTagByName",
+    "add_tag_by_name_validated": ".addTagByName",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
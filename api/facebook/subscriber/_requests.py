@@ -1,6 +1,6 @@
 from pydantic import Field
 
-from app.core.third_party_integrations.manychat.api._requests import BaseRequest
+from app.core.third_party_integrations.manychat.api._base import BaseRequest
 
 
 # In _requests.py
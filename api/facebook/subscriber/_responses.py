@@ -1,36 +1,39 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing_extensions import Annotated, NotRequired, TypedDict
 
 from app.core.third_party_integrations.manychat.api._responses import SuccessResponse
 
 
-class UserRef(BaseModel):
+class UserRef(TypedDict):
     """Model for user reference data."""
-    user_ref: str = Field(..., description="User reference ID")
-    opted_in: datetime = Field(..., description="When the user opted in")
+    user_ref: Annotated[str, Field(description="User reference ID")]
+    opted_in: Annotated[datetime, Field(description="When the user opted in")]
 
 
-class CustomField(BaseModel):
+class CustomField(TypedDict):
     """Model for custom field data."""
-    id: int = Field(..., description="Field ID")
-    name: str = Field(..., description="Field name")
-    type: str = Field(..., description="Field type (text, number, etc.)")
-    description: Optional[str] = Field(None, description="Field description")
-    value: Union[str, int, bool, datetime, None] = Field(
-        None,
-        description="Field value (can be string, number, boolean, or datetime)"
-    )
+    id: Annotated[int, Field(description="Field ID")]
+    name: Annotated[str, Field(description="Field name")]
+    type: Annotated[str, Field(description="Field type (text, number, etc.)")]
+    description: NotRequired[Annotated[Optional[str], Field(description="Field description")]]
+    value: NotRequired[Annotated[
+        Union[str, int, bool, datetime, None],
+        Field(description="Field value (can be string, number, boolean, or datetime)")
+    ]]
 
 
-class Tag(BaseModel):
+class Tag(TypedDict):
     """Model for tag data."""
-    id: int = Field(..., description="Tag ID")
-    name: str = Field(..., description="Tag name")
+    id: Annotated[int, Field(description="Tag ID")]
+    name: Annotated[str, Field(description="Tag name")]
 
 
 class SubscriberInfo(BaseModel):
     """Model for subscriber information."""
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(..., description="Subscriber ID")
     page_id: str = Field(..., description="Page ID")
     user_refs: List[UserRef] = Field(
@@ -71,4 +74,6 @@ class SubscriberInfo(BaseModel):
 
 class GetSubscriberInfoResponse(SuccessResponse):
     """Response model for get subscriber info endpoint."""
+    model_config = ConfigDict(defer_build=True)
+
     data: SubscriberInfo = Field(..., description="Subscriber information")
\ No newline at end of file
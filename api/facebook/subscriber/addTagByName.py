@@ -13,6 +13,9 @@ from app.core.third_party_integrations.manychat.api.facebook.subscriber._request
 )
 from app.core.third_party_integrations.manychat.client import ManyChatClient
 
+# Specialized body builder for this fixed-shape request
+_build_add_tag_body = AddTagByNameRequest.compile_builder()
+
 
 async def add_tag_by_name(
     client: ManyChatClient,
@@ -23,6 +26,40 @@ async def add_tag_by_name(
     """
     Add a tag to a subscriber by tag name.
 
+    The request body is built by a compiled builder and is not validated by
+    ``AddTagByNameRequest``; use ``add_tag_by_name_validated`` for untrusted
+    input.
+
+    Args:
+        client: An authenticated ManyChatClient instance.
+        subscriber_id: The ID of the subscriber to tag.
+        tag_name: The name of the tag to add.
+
+    Returns:
+        SuccessResponse indicating the result of the operation.
+
+    Raises:
+        ManyChatAPIError: If the API request fails.
+        ManyChatAuthError: If authentication fails.
+        ManyChatRateLimitError: If rate limit is exceeded.
+    """
+    return await client.request(
+        method="POST",
+        endpoint="fb/subscriber/addTagByName",
+        body=_build_add_tag_body(subscriber_id, tag_name),
+        response_model=SuccessResponse
+    )
+
+
+async def add_tag_by_name_validated(
+    client: ManyChatClient,
+    *,
+    subscriber_id: str,
+    tag_name: str
+) -> SuccessResponse:
+    """
+    Add a tag to a subscriber by tag name, validating the request first.
+
     Args:
         client: An authenticated ManyChatClient instance.
         subscriber_id: The ID of the subscriber to tag.
@@ -55,7 +92,7 @@ async def add_tag_by_name(
 
 # Example usage:
 # async def example():
-#     client = ManyChatClient(api_key="your_api_key")
+#     client = get_client(api_key="your_api_key")
 #     try:
 #         # Add a tag to a subscriber
 #         response = await add_tag_by_name(
@@ -49,7 +49,7 @@ async def get_subscriber_info(
     response = await client.request(
         method="GET",
         endpoint="fb/subscriber/getInfo",
-        params=request.dict(exclude_none=True, by_alias=True),
+        params=request.as_params,
         response_model=GetSubscriberInfoResponse
     )
     return response
@@ -57,7 +57,7 @@ async def get_subscriber_info(
 
 # Example usage:
 # async def example():
-#     client = ManyChatClient(api_key="your_api_key")
+#     client = get_client(api_key="your_api_key")
 #     try:
 #         # Get subscriber info
 #         response = await get_subscriber_info(
@@ -68,6 +68,6 @@ async def get_subscriber_info(
 #         subscriber = response.data
 #         print(f"Subscriber: {subscriber.first_name} {subscriber.last_name}")
 #         print(f"Email: {subscriber.email}")
-#         print(f"Tags: {[tag.name for tag in subscriber.tags]}")
+#         print(f"Tags: {[tag['name'] for tag in subscriber.tags]}")
 #     finally:
 #         await client.close()ss
\ No newline at end of file
@@ -7,23 +7,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional, TypeVar, cast
-from urllib.parse import urljoin
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, TypeVar, cast
 
 import aiohttp
 import backoff
+import orjson
 from pydantic import ValidationError
 
 from . import __version__
 from .config import ManyChatConfig, config
-from .api.facebook._exceptions import (
+from .api._exceptions import (
     ManyChatAPIError,
     ManyChatRateLimitError,
     ManyChatValidationError,
     ManyChatAuthError,
 )
-from .api.facebook._requests import BaseRequest
-from .api.facebook._responses import BaseResponse
+from .api._base import BaseRequest, BaseResponse
 
 # Type variables for generic method returns
 T = TypeVar("T", bound=BaseResponse)
@@ -31,6 +31,42 @@ T = TypeVar("T", bound=BaseResponse)
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Endpoints wrapped by this SDK; their full URLs are built once per client
+ENDPOINTS = (
+    "fb/page/getInfo",
+    "fb/page/getTags",
+    "fb/page/setBotFields",
+    "fb/subscriber/addTagByName",
+    "fb/subscriber/getInfo",
+)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
+
+def _cache_key(
+    method: str,
+    endpoint: str,
+    request_data: Optional[BaseRequest],
+    params: Optional[Dict[str, Any]],
+    body: Optional[Dict[str, Any]],
+    response_model: type,
+) -> Hashable:
+    """Key a cached response by the request and the model it is parsed into."""
+    params_key = frozenset(
+        (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+        for name, value in params.items()
+    ) if params else None
+    if request_data is not None:
+        body_key: Optional[bytes] = request_data.as_json_bytes
+    elif body is not None:
+        body_key = orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+    else:
+        body_key = None
+    return (method, endpoint.lstrip("/"), params_key, body_key, response_model)
+
 
 class ManyChatClient:
     """Async client for interacting with the ManyChat API.
@@ -39,18 +75,47 @@ class ManyChatClient:
     retries, and error handling.
     """
     
-    def __init__(self, config: Optional[ManyChatConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ManyChatConfig] = None,
+        *,
+        api_key: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         """Initialize the ManyChat client.
         
         Args:
             config: Configuration instance. If not provided, loads from environment.
+            api_key: API key to use when no config is provided.
+            session: Existing aiohttp session to reuse. The client does not
+                close sessions it did not create.
         """
-        self.config = config or ManyChatConfig()
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._rate_limit_semaphore = asyncio.Semaphore(
-            self.config.rate_limit / 60  # Convert per-minute to per-second
+        if config is None:
+            config = ManyChatConfig(api_key=api_key) if api_key else ManyChatConfig()
+        self.config = config
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._headers: Mapping[str, str] = MappingProxyType(
+            {"Authorization": f"Bearer {self.config.api_key}"}
         )
-        self._last_request_time: float = 0
+        self._json_headers: Mapping[str, str] = MappingProxyType(
+            {**self._headers, "Content-Type": "application/json"}
+        )
+        self._base = self.config.base_url.rstrip("/")
+        self._url_cache: Dict[str, str] = {
+            endpoint: f"{self._base}/{endpoint}" for endpoint in ENDPOINTS
+        }
+        # Token bucket: holds up to rate_limit tokens, refilled continuously
+        self._refill_rate = self.config.rate_limit / self.config.rate_window  # per second
+        self._tokens: float = float(self.config.rate_limit)
+        self._last_refill: Optional[float] = None
+        self._rate_limit_lock = asyncio.Lock()
+        # Cached responses: (method, endpoint, params, body, model) -> (expires_at, response)
+        self._response_cache: Dict[Hashable, Tuple[float, BaseResponse]] = {}
+        # Created on first use by api.facebook.setBotFields.set_bot_field
+        self._bot_fields_batcher: Optional[Any] = None
+        # Event loop the session, lock and batcher above belong to
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
     async def __aenter__(self) -> "ManyChatClient":
         """Async context manager entry."""
@@ -62,32 +127,94 @@ class ManyChatClient:
         await self.close()
     
     async def start(self) -> None:
-        """Initialize the client session."""
+        """Initialize the client session.
+        
+        The session uses a keep-alive connection pool sized by
+        ``pool_limit``/``pool_limit_per_host``. All endpoints live on the
+        same host, so ``pool_limit_per_host`` bounds concurrent requests.
+        Resolved addresses are cached for ``dns_cache_ttl`` seconds.
+        """
+        self._bind_loop()
         if self._session is None or self._session.closed:
+            self._owns_session = True
+            connector = aiohttp.TCPConnector(
+                limit=self.config.pool_limit,
+                limit_per_host=self.config.pool_limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+                enable_cleanup_closed=True,
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
                 headers={
                     "User-Agent": f"ManyChat-Python-SDK/{__version__}",
                     "Accept": "application/json",
                     "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.api_key}",
                 },
                 timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                raise_for_status=True,
+                json_serialize=_json_dumps,
             )
     
     async def close(self) -> None:
         """Close the client session."""
-        if self._session and not self._session.closed:
+        self._bind_loop()
+        if self._bot_fields_batcher is not None:
+            await self._bot_fields_batcher.aclose()
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
     
+    def _bind_loop(self) -> None:
+        """Drop loop-bound state left over from a previous event loop.
+        
+        A shared client (see ``get_client``) may be used from several
+        ``asyncio.run`` calls, one after another. The session it created, its
+        rate-limit lock and its bot field batcher only work on the loop they
+        were made on, so they are recreated once that loop has closed.
+        Injected sessions are left alone.
+        
+        Raises:
+            RuntimeError: If the client is still bound to another open loop,
+                such as one running in a different thread.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            if not self._loop.is_closed():
+                raise RuntimeError(
+                    "ManyChatClient is in use on another event loop; "
+                    "create a separate client for each thread's loop"
+                )
+            if self._owns_session and self._session is not None:
+                # Its loop is gone, so it cannot be closed; just let it go
+                self._session.detach()
+                self._session = None
+            self._rate_limit_lock = asyncio.Lock()
+            self._bot_fields_batcher = None
+        self._loop = loop
+    
+    def _refill_tokens(self, now: float) -> None:
+        """Add the tokens accrued since the last refill, up to the bucket size."""
+        if self._last_refill is not None:
+            self._tokens = min(
+                float(self.config.rate_limit),
+                self._tokens + (now - self._last_refill) * self._refill_rate,
+            )
+        self._last_refill = now
+    
     async def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        async with self._rate_limit_semaphore:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self._last_request_time
-            if elapsed < 1.0:  # Ensure at least 1s between requests
-                await asyncio.sleep(1.0 - elapsed)
-            self._last_request_time = asyncio.get_event_loop().time()
+        """Take a token from the rate-limit bucket, waiting if it is empty.
+        
+        Up to ``rate_limit`` requests can start at once; beyond that, requests
+        are admitted at ``rate_limit`` per ``rate_window`` seconds.
+        """
+        async with self._rate_limit_lock:
+            loop = asyncio.get_running_loop()
+            self._refill_tokens(loop.time())
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+                self._refill_tokens(loop.time())
+            self._tokens -= 1
     
     @backoff.on_exception(
         backoff.expo,
@@ -104,6 +231,8 @@ class ManyChatClient:
         method: str,
         endpoint: str,
         request_data: Optional[BaseRequest] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
         response_model: type[T] = BaseResponse,
     ) -> T:
         """Make an authenticated request to the ManyChat API.
@@ -112,6 +241,8 @@ class ManyChatClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             request_data: Request data model
+            params: Query string parameters, sent instead of a JSON body
+            body: Pre-built JSON body, sent as-is instead of ``request_data``
             response_model: Pydantic model for response validation
             
         Returns:
@@ -126,10 +257,28 @@ class ManyChatClient:
         if self._session is None or self._session.closed:
             await self.start()
         
-        url = urljoin(self.config.api_url, endpoint)
+        # Known endpoints are prebuilt; other paths are joined per call and not kept
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            path = endpoint.lstrip("/")
+            url = self._url_cache.get(path)
+            if url is None:
+                url = f"{self._base}/{path}"
+            else:
+                # A known endpoint spelled with a leading slash
+                self._url_cache[endpoint] = url
         
-        # Prepare request data
-        json_data = request_data.dict(exclude_none=True) if request_data else None
+        # Prepare request data; models are sent as their cached JSON bytes
+        headers = self._headers
+        if params is not None:
+            payload: Dict[str, Any] = {"params": params}
+        elif body is not None:
+            payload = {"json": body}
+        elif request_data is not None:
+            payload = {"data": request_data.as_json_bytes}
+            headers = self._json_headers
+        else:
+            payload = {"json": None}
         
         # Enforce rate limiting
         await self._enforce_rate_limit()
@@ -139,21 +288,22 @@ class ManyChatClient:
                 "Making %s request to %s with data: %s",
                 method,
                 url,
-                json_data,
+                payload,
             )
             
             async with self._session.request(
-                method=method,
-                url=url,
-                json=json_data,
+                method,
+                url,
+                headers=headers,
+                **payload,
             ) as response:
-                response_data = await response.json()
+                body = await response.read()
                 
                 logger.debug(
                     "Received response from %s %s: %s",
                     method,
                     url,
-                    response_data,
+                    body,
                 )
                 
                 # Handle API errors
@@ -166,16 +316,23 @@ class ManyChatClient:
                             f"Rate limit exceeded. Retry after {retry_after} seconds",
                             retry_after=retry_after,
                         )
+                    try:
+                        response_data = orjson.loads(body) if body else None
+                    except orjson.JSONDecodeError:
+                        # Proxies and gateways may answer with HTML or plain text
+                        response_data = body.decode(errors="replace")
                     raise ManyChatAPIError(
                         f"API request failed with status {response.status}: {response_data}",
                         status_code=response.status,
                         response=response_data,
                     )
                 
-                # Validate and parse response
                 try:
-                    return response_model.parse_obj(response_data)
-                except ValidationError as e:
+                    if not self.config.validate_responses:
+                        return response_model.from_trusted_response(orjson.loads(body))
+                    # Validate and parse the raw body in a single pass
+                    return response_model.from_api_bytes(body)
+                except (ValidationError, ValueError) as e:
                     raise ManyChatValidationError(
                         f"Failed to validate response: {e}"
                     ) from e
@@ -187,6 +344,81 @@ class ManyChatClient:
             logger.error("Request timed out")
             raise ManyChatAPIError("Request timed out") from e
     
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        request_data: Optional[BaseRequest] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        response_model: type[T] = BaseResponse,
+        cache: bool = False,
+    ) -> T:
+        """Make an authenticated request to the ManyChat API.
+        
+        This is the entry point used by the endpoint modules under ``api/``.
+        See ``_request`` for argument and error details.
+        
+        Args:
+            cache: Reuse the response of an identical earlier call for up to
+                ``cache_ttl`` seconds. Only for idempotent requests; cached
+                responses are shared and must not be mutated.
+        """
+        self._bind_loop()
+        if not cache:
+            return await self._request(
+                method,
+                endpoint,
+                request_data=request_data,
+                params=params,
+                body=body,
+                response_model=response_model,
+            )
+        
+        key = _cache_key(method, endpoint, request_data, params, body, response_model)
+        now = asyncio.get_running_loop().time()
+        entry = self._response_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return cast(T, entry[1])
+        self._evict_expired(now)
+        
+        response = await self._request(
+            method,
+            endpoint,
+            request_data=request_data,
+            params=params,
+            body=body,
+            response_model=response_model,
+        )
+        self._response_cache[key] = (now + self.config.cache_ttl, response)
+        return response
+    
+    def _evict_expired(self, now: float) -> None:
+        """Drop cached responses whose ``cache_ttl`` has run out."""
+        expired = [key for key, (expires_at, _) in self._response_cache.items() if expires_at <= now]
+        for key in expired:
+            del self._response_cache[key]
+    
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._response_cache.clear()
+    
+    async def batch(self, calls: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Run several API calls concurrently.
+        
+        Concurrency is bounded by the connection pool
+        (``pool_limit_per_host``) and the client's rate limiting.
+        
+        Args:
+            calls: Awaitables such as ``add_tag_by_name(client, ...)`` calls.
+            
+        Returns:
+            Results in the order the calls were given. A call that failed
+            yields its exception instead of raising.
+        """
+        return await asyncio.gather(*calls, return_exceptions=True)
+    
     # Public API methods will be added here
     # Example:
     # async def get_subscriber_info(self, subscriber_id: str) -> SubscriberInfoResponse:
@@ -200,7 +432,29 @@ class ManyChatClient:
     #     )
 
 
+# Shared clients, one per (api_key, api_url)
+_clients: Dict[Tuple[str, str], ManyChatClient] = {}
+
+
+def get_client(api_key: Optional[str] = None) -> ManyChatClient:
+    """Return the shared client for an API key, creating it on first use.
+    
+    Prefer this over constructing ``ManyChatClient`` per call: the shared
+    client keeps its connection pool, rate limit and response cache across
+    calls. Its session is opened lazily on the first request.
+    
+    Args:
+        api_key: API key to use. Defaults to the environment configuration.
+    """
+    client_config = ManyChatConfig(api_key=api_key) if api_key else config
+    key = (client_config.api_key, client_config.api_url)
+    shared = _clients.get(key)
+    if shared is None:
+        shared = _clients[key] = ManyChatClient(client_config)
+    return shared
+
+
 # Singleton instance for easy import
-client = ManyChatClient()
+client = get_client()
 
-__all__ = ["ManyChatClient", "client"]
+__all__ = ["ManyChatClient", "client", "get_client"]
@@ -13,7 +13,7 @@ class ManyChatConfig(BaseSettings):
     # Required configuration
     api_key: str = Field(..., description="API key for ManyChat authentication")
     api_version: str = Field("v1", description="API version to use")
-    base_url: str = Field("https://api.manychat.com/fb", 
+    base_url: str = Field("https://api.manychat.com", 
                          description="Base URL for ManyChat API endpoints")
     
     # Optional configuration with defaults
@@ -21,9 +21,30 @@ class ManyChatConfig(BaseSettings):
     max_retries: int = Field(3, description="Maximum number of retries for failed requests")
     retry_delay: float = Field(1.0, description="Delay between retries in seconds")
     
+    # Connection pooling
+    pool_limit: int = Field(100, description="Maximum number of pooled connections")
+    pool_limit_per_host: int = Field(
+        30,
+        description="Maximum concurrent connections per host; every ManyChat "
+                    "endpoint shares one host, so this caps in-flight requests"
+    )
+    keepalive_timeout: float = Field(
+        75, description="Seconds to keep idle pooled connections open for reuse"
+    )
+    dns_cache_ttl: int = Field(
+        300, description="Seconds to cache resolved API host addresses"
+    )
+    
+    # Response handling
+    validate_responses: bool = Field(
+        True,
+        description="Validate API responses; disable to trust ManyChat payloads "
+                    "and build response models without validation"
+    )
+    
     # Rate limiting
-    rate_limit: int = Field(100, description="Maximum requests per minute")
-    rate_window: int = Field(60, description="Rate limit window in seconds")
+    rate_limit: int = Field(100, gt=0, description="Maximum requests per rate window")
+    rate_window: int = Field(60, gt=0, description="Rate limit window in seconds")
     
     # Logging and debugging
     log_level: str = Field("INFO", description="Logging level")